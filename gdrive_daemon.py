@@ -1,6 +1,8 @@
 import logging
+import os
 import subprocess
-import time
+
+from inotify_simple import INotify, flags
 
 logging.basicConfig(
     level=logging.INFO,
@@ -8,7 +10,36 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
-while True:
-    log.info("Sync google drive")
-    subprocess.Popen("rclone sync recordings/ gdrive:ans_machine_recordings", shell=True)
-    time.sleep(60)     
\ No newline at end of file
+RECORD_DIR = "recordings/"
+REMOTE = "gdrive:ans_machine_recordings"
+COALESCE_MS = 2000   # keep draining events until the directory goes quiet
+SYNC_CMD = [
+    "rclone", "sync",
+    "--transfers", "4",
+    "--checkers", "8",
+    "--fast-list",
+    "--min-age", "5s",   # skip files still being written
+    RECORD_DIR, REMOTE,
+]
+
+
+def main() -> None:
+    # On a fresh install the directory does not exist until the first
+    # recording; add_watch would raise and the unit would crash-loop.
+    os.makedirs(RECORD_DIR, exist_ok=True)
+    inotify = INotify()
+    inotify.add_watch(RECORD_DIR, flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE)
+    log.info("Watching %s for new recordings.", RECORD_DIR)
+
+    while True:
+        # Block in the kernel until something lands in recordings/ ...
+        inotify.read(timeout=None)
+        # ... then coalesce the burst so one sync covers it all.
+        while inotify.read(timeout=COALESCE_MS):
+            pass
+        log.info("Sync google drive")
+        subprocess.run(SYNC_CMD, check=False)
+
+
+if __name__ == "__main__":
+    main()
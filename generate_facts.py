@@ -0,0 +1,179 @@
+# @file generate_facts.py
+# @author Alberto Occelli
+# @brief Generate the daily "accadde oggi" audio clips from the Italian
+# Wikipedia day page (== Eventi == section), one MP3 per year.
+
+import datetime
+import hashlib
+import io
+import os
+import re
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import requests
+import yaml
+from gtts import gTTS
+from tqdm import tqdm
+
+EVENTS_DIR = Path("events")
+DATE_FILE = Path("date.yaml")
+TTS_LANG = "it"
+MAX_WORKERS = 4   # gTTS is network-bound, ffmpeg runs out-of-process
+PAGE_CACHE_MAX_AGE = 24 * 3600   # seconds before the cached page goes stale
+
+# Indexed by month - 1: a plain tuple lookup, no dict hashing and no
+# locale-dependent strftime("%B").
+ITALIAN_MONTHS = (
+    "gennaio", "febbraio", "marzo", "aprile", "maggio", "giugno",
+    "luglio", "agosto", "settembre", "ottobre", "novembre", "dicembre",
+)
+
+WIKI_API = "https://it.wikipedia.org/w/api.php"
+HTTP_TIMEOUT = 30
+# One "* 1234 – event text" bullet per match, anchored per line. In raw
+# wikitext the year is usually a link ("* [[1492]] – ..."), so the brackets
+# are optional around the capture.
+YEAR_RE = re.compile(r"^\*\s*(?:\[\[)?(\d{3,4})(?:\]\])?\s*[–-]\s*(.+)$",
+                     re.MULTILINE)
+# Markup to scrub before synthesis: refs and templates vanish, links keep
+# their label ([[Target|label]] → label, [[Target]] → Target).
+REF_RE = re.compile(r"<ref[^>/]*/>|<ref.*?</ref>", re.DOTALL)
+TEMPLATE_RE = re.compile(r"\{\{[^{}]*\}\}")
+LINK_RE = re.compile(r"\[\[(?:[^\[\]|]*\|)?([^\[\]|]*)\]\]")
+
+## @brief Fetch only the wikitext of the page's "Eventi" section.
+#  Two small API calls (section index, then section wikitext) replace the
+#  full-article download the wikipedia package used to do.
+def fetch_events_wikitext(page_title: str) -> str:
+    resp = requests.get(
+        WIKI_API,
+        params={"action": "parse", "page": page_title,
+                "prop": "sections", "format": "json"},
+        timeout=HTTP_TIMEOUT,
+    )
+    resp.raise_for_status()
+    sections = resp.json()["parse"]["sections"]
+    index = next((s["index"] for s in sections if s["line"] == "Eventi"), None)
+    if index is None:
+        raise ValueError(f"Page {page_title!r} has no 'Eventi' section")
+    resp = requests.get(
+        WIKI_API,
+        params={"action": "parse", "page": page_title, "section": index,
+                "prop": "wikitext", "format": "json"},
+        timeout=HTTP_TIMEOUT,
+    )
+    resp.raise_for_status()
+    return resp.json()["parse"]["wikitext"]["*"]
+
+## @brief Reduce a wikitext event line to plain speakable text.
+#  gTTS would otherwise read the markup out loud: refs and templates are
+#  dropped, links collapse to their label, quote-bolding disappears.
+def strip_wikitext(text: str) -> str:
+    text = REF_RE.sub("", text)
+    # Innermost-out so nested templates ({{a|{{b}}}}) disappear too.
+    while True:
+        text, replaced = TEMPLATE_RE.subn("", text)
+        if not replaced:
+            break
+    text = LINK_RE.sub(r"\1", text)
+    text = text.replace("'''", "").replace("''", "")
+    return " ".join(text.split())
+
+## @brief Synthesise *speech* and encode it straight to 16 kHz mono MP3.
+#  gTTS renders into an in-memory buffer which is piped to a single ffmpeg
+#  invocation on stdin — no intermediate file, no second decode+encode pass.
+#  The clip lands under a temp name and is renamed into place only on
+#  success: the exists() skip in generate_day_events must never mistake a
+#  truncated encode (killed process, reboot, full disk) for a finished
+#  clip, and the playback side must never pick up a half-written file.
+def tts_to_mp3(speech: str, out_path: Path) -> None:
+    buf = io.BytesIO()
+    gTTS(speech, lang=TTS_LANG).write_to_fp(buf)
+    tmp = out_path.with_suffix(".mp3.tmp")
+    try:
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-i", "pipe:0",
+             "-ar", "16000", "-ac", "1", "-codec:a", "libmp3lame", "-q:a", "9",
+             str(tmp)],
+            input=buf.getvalue(),
+            check=True,
+        )
+        os.replace(tmp, out_path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        raise
+
+## @brief Download today's Wikipedia day page and regenerate events/*.mp3.
+def generate_day_events() -> None:
+    now = datetime.datetime.now()
+    day = now.day
+    month = ITALIAN_MONTHS[now.month - 1]
+    page_title = f"{day}_{month}"
+
+    # Cache the raw section text so a re-run on the same day (e.g. after a
+    # partial failure) does not hit Wikipedia again.
+    EVENTS_DIR.mkdir(exist_ok=True)
+    cache = EVENTS_DIR / f"wiki_{day}_{month}.txt"
+    if cache.exists() and time.time() - cache.stat().st_mtime < PAGE_CACHE_MAX_AGE:
+        events_block = cache.read_text()
+    else:
+        events_block = fetch_events_wikitext(page_title)
+        cache.write_text(events_block)
+
+    events = [(int(year), stripped)
+              for year, text in YEAR_RE.findall(events_block)
+              if (stripped := strip_wikitext(text))]
+    # A day page always has events; an empty parse means the fetch or the
+    # regex broke. Bail out before touching the existing clips (and before
+    # date.yaml marks the day done) so yesterday's audio keeps playing.
+    if not events:
+        raise ValueError(f"No events parsed from page {page_title!r}")
+
+    # Name each clip after a digest of its speech text: unchanged years keep
+    # their file across runs and only new/edited entries are synthesised.
+    wanted = {}
+    for year, text in events:
+        speech = f"Nel {year}: {text}"
+        digest = hashlib.blake2b(speech.encode()).hexdigest()[:16]
+        wanted[EVENTS_DIR / f"{year}_{month}_{day}_{digest}.mp3"] = speech
+
+    jobs = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        for out_path, speech in wanted.items():
+            if out_path.exists():
+                continue
+            jobs[pool.submit(tts_to_mp3, speech, out_path)] = out_path
+        for future in tqdm(as_completed(jobs), total=len(jobs), desc="TTS"):
+            future.result()
+
+    # Only now that every new clip exists is it safe to drop yesterday's:
+    # a TTS or network failure above propagates out of future.result() and
+    # leaves the old clips (and no date.yaml update) in place for a retry.
+    for old in EVENTS_DIR.glob("*.mp3"):
+        if old not in wanted:
+            old.unlink()
+    # Temp files from a run that died mid-encode (reboot, OOM) go too.
+    for leftover in EVENTS_DIR.glob("*.mp3.tmp"):
+        leftover.unlink()
+
+    with open(DATE_FILE, "w") as f:
+        yaml.safe_dump({"day": day, "month": month}, f)
+
+
+if __name__ == "__main__":
+    try:
+        with open(DATE_FILE) as f:
+            date_rec = yaml.safe_load(f)
+    except FileNotFoundError:
+        date_rec = None
+
+    # Take "now" exactly once: a run straddling midnight must not compare
+    # day and month from two different instants (and the month must come
+    # from ITALIAN_MONTHS — strftime("%B") is locale-dependent).
+    now = datetime.datetime.now()
+    today_key = (now.day, ITALIAN_MONTHS[now.month - 1])
+    if date_rec is None or (date_rec.get("day"), date_rec.get("month")) != today_key:
+        generate_day_events()
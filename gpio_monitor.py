@@ -1,25 +1,82 @@
-import RPi.GPIO as GPIO
 import time
 
-# Usa la numerazione BCM (i numeri GPIO, non i pin fisici)
-GPIO.setmode(GPIO.BCM)
+try:
+    import gpiod
+    from gpiod.line import Bias, Edge
+except ImportError:   # immagine senza libgpiod v2: si torna al polling
+    gpiod = None
+    import RPi.GPIO as GPIO
+
+GPIO_CHIP = "/dev/gpiochip0"
 
 # Pin da monitorare
 PINS = [10, 11]
 
-# Configura i pin come input con pull-up (modifica se serve pull-down)
-for pin in PINS:
-    GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+# Intervallo di polling adattivo (solo fallback): stretto subito dopo una
+# transizione, cresce fino a MAX quando non succede niente
+MIN_DELAY = 0.002
+MAX_DELAY = 0.2
 
-print(f"Monitoraggio stato GPIO {PINS[0]} e {PINS[1]} (premi Ctrl+C per uscire)")
 
-try:
-    while True:
-        states = {pin: GPIO.input(pin) for pin in PINS}
-        print(f"GPIO {PINS[0]}: {'ALTO' if states[PINS[0]] else 'BASSO'} | GPIO {PINS[1]}: {'ALTO' if states[PINS[1]] else 'BASSO'}", end='\r')
-        time.sleep(0.01)
-
-except KeyboardInterrupt:
-    print("\nUscita dal monitor.")
-finally:
-    GPIO.cleanup()
+def _monitor_events():
+    # Un evento (e una print) per transizione reale: niente loop a 100 Hz,
+    # il processo dorme nel kernel finché una linea non cambia stato.
+    request = gpiod.request_lines(
+        GPIO_CHIP,
+        consumer="gpio-monitor",
+        config={
+            pin: gpiod.LineSettings(bias=Bias.PULL_UP, edge_detection=Edge.BOTH)
+            for pin in PINS
+        },
+    )
+    print(f"Monitoraggio eventi GPIO {PINS[0]} e {PINS[1]} (premi Ctrl+C per uscire)")
+    try:
+        while True:
+            request.wait_edge_events(None)
+            for ev in request.read_edge_events():
+                alto = ev.event_type is ev.Type.RISING_EDGE
+                print(f"GPIO {ev.line_offset}: {'ALTO' if alto else 'BASSO'}")
+    except KeyboardInterrupt:
+        print("\nUscita dal monitor.")
+    finally:
+        request.release()
+
+
+def _monitor_polling():
+    # Usa la numerazione BCM (i numeri GPIO, non i pin fisici)
+    GPIO.setmode(GPIO.BCM)
+
+    # Configura i pin come input con pull-up (modifica se serve pull-down)
+    for pin in PINS:
+        GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+
+    print(f"Monitoraggio stato GPIO {PINS[0]} e {PINS[1]} (premi Ctrl+C per uscire)")
+    prev_states = None
+    # Nomi locali per il loop caldo: niente lookup di modulo a ogni giro
+    _input = GPIO.input
+    _sleep = time.sleep
+    pin_a, pin_b = PINS
+    delay = MIN_DELAY
+    try:
+        while True:
+            states = (_input(pin_a), _input(pin_b))
+            # Stampa (e quindi syscall su stdout) solo quando qualcosa cambia
+            if states != prev_states:
+                print(f"GPIO {pin_a}: {'ALTO' if states[0] else 'BASSO'} | GPIO {pin_b}: {'ALTO' if states[1] else 'BASSO'}")
+                prev_states = states
+                delay = MIN_DELAY
+            else:
+                delay = min(delay * 1.5, MAX_DELAY)
+            _sleep(delay)
+
+    except KeyboardInterrupt:
+        print("\nUscita dal monitor.")
+    finally:
+        GPIO.cleanup()
+
+
+if __name__ == "__main__":
+    if gpiod is not None:
+        _monitor_events()
+    else:
+        _monitor_polling()
@@ -1,17 +1,19 @@
 from keypad import keypad
 
+# Tabella di dispatch O(1); le chiavi sono stringhe perché il keypad in
+# modalità "multiple" passa il numero composto come stringa (gli zeri
+# iniziali di "011351789" si perdono se convertito in int).
+DISPATCH = {
+    "011351789": lambda: print("Hai chiamato casa"),
+    # Aggiungi qui il codice per accendere la luce
+    "2": lambda: print("Hai premuto 2: spengo la luce"),
+    # Codice per spegnere la luce
+    "3": lambda: print("Hai premuto 3: suono il campanello"),
+    # Codice per suonare campanello
+}
+
 def on_number_composed(number):
-    if number == "011351789":
-        print("Hai chiamato casa")
-        # Aggiungi qui il codice per accendere la luce
-    elif number == 2:
-        print("Hai premuto 2: spengo la luce")
-        # Codice per spegnere la luce
-    elif number == 3:
-        print("Hai premuto 3: suono il campanello")
-        # Codice per suonare campanello
-    else:
-        print(f"Numero {number} non gestito")
+    DISPATCH.get(str(number), lambda: print(f"Numero {number} non gestito"))()
 
 if __name__ == "__main__":
-    keypad(on_number_composed)
\ No newline at end of file
+    keypad(on_number_composed)
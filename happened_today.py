@@ -0,0 +1,41 @@
+# @file happened_today.py
+# @author Alberto Occelli
+# @brief Play a random "accadde oggi" clip (see generate_facts.py) when the
+# handset is lifted; hang up to stop playback.
+
+import logging
+import time
+
+from player import stop_audio
+
+import hooksm
+from playback import ensure_pcm_cache, play_random_event
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+log = logging.getLogger(__name__)
+
+
+## @brief Rising edge → play a random event clip; falling edge → stop it.
+def main() -> None:
+    ensure_pcm_cache()
+
+    def on_rising() -> None:
+        time.sleep(0.5)
+        log.info("Hang down detected → playing random event.")
+        play_random_event()
+
+    def on_falling() -> None:
+        log.info("Hang up detected → stopping playback.")
+        stop_audio()
+
+    try:
+        hooksm.run(on_rising, on_falling, consumer="happened-today")
+    finally:
+        stop_audio()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# @file hooksm.py
+# @author Alberto Occelli
+# @brief Shared hook-switch event loop: kernel-debounced gpiod edge events,
+# dispatched to caller-supplied callbacks. Every hook-driven entry point
+# (main.py, happened_today.py) parameterizes this one loop, so improvements
+# to edge handling land once instead of per script.
+
+import logging
+import os
+import selectors
+from datetime import timedelta
+
+import gpiod
+from gpiod.line import Bias, Edge
+
+log = logging.getLogger(__name__)
+
+GPIO_CHIP = "/dev/gpiochip0"               # GPIO character device
+DEFAULT_PIN = 17                           # Hook-switch line (BCM scheme)
+DEBOUNCE_MS = 50                           # Hook-switch contact bounce window
+
+## @brief Request the hook line for kernel edge events.
+#  The debounce lives kernel-side (same as the numpad pin in keypad.py):
+#  contact bounce alternates directions, so gating rising and falling
+#  independently in userland lets the first spurious edge of the opposite
+#  direction through every time. The kernel debouncer only reports an edge
+#  once the line has held its new level for the whole window.
+#  @return The gpiod line request delivering edge events for *pin*.
+def setup_gpio(pin: int = DEFAULT_PIN, consumer: str = "ans-machine",
+               debounce_ms: int = DEBOUNCE_MS) -> gpiod.LineRequest:
+    request = gpiod.request_lines(
+        GPIO_CHIP,
+        consumer=consumer,
+        config={
+            pin: gpiod.LineSettings(
+                bias=Bias.PULL_UP,
+                edge_detection=Edge.BOTH,
+                debounce_period=timedelta(milliseconds=debounce_ms),
+            ),
+        },
+    )
+    log.info("GPIO initialised (line %s on %s, edge events, %d ms debounce).",
+             pin, GPIO_CHIP, debounce_ms)
+    return request
+
+## @brief Drain any pending bytes from a non-blocking pipe read end.
+def drain(fd: int) -> None:
+    try:
+        while os.read(fd, 64):
+            pass
+    except BlockingIOError:
+        pass
+
+## @brief Block on kernel edge events and dispatch them to callbacks.
+#  Edges arrive already debounced by the kernel (see setup_gpio), so every
+#  event read here is a real hook transition.  An optional auxiliary fd
+#  (e.g. a playback-done self-pipe) is registered with the same selector;
+#  when it becomes readable it is drained and *on_aux* is invoked.  Returns
+#  on KeyboardInterrupt, releasing the line request.
+def run(on_rising, on_falling, *, pin: int = DEFAULT_PIN,
+        consumer: str = "ans-machine", aux_fd=None, on_aux=None,
+        debounce_ms: int = DEBOUNCE_MS) -> None:
+    request = setup_gpio(pin, consumer, debounce_ms)
+
+    sel = selectors.DefaultSelector()
+    sel.register(request.fd, selectors.EVENT_READ)
+    if aux_fd is not None:
+        sel.register(aux_fd, selectors.EVENT_READ)
+
+    try:
+        while True:
+            for key, _ in sel.select(timeout=None):
+                if key.fd == request.fd:
+                    for event in request.read_edge_events():
+                        if event.event_type is event.Type.RISING_EDGE:
+                            on_rising()
+                        else:
+                            on_falling()
+                else:
+                    drain(key.fd)
+                    if on_aux is not None:
+                        on_aux()
+
+    except KeyboardInterrupt:
+        log.info("Keyboard interrupt received – exiting.")
+
+    finally:
+        sel.close()
+        request.release()
+        log.info("GPIO released. Bye!")
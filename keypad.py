@@ -1,12 +1,88 @@
-import RPi.GPIO as GPIO
 import time
+from datetime import timedelta
+
+try:
+    import gpiod
+    from gpiod.line import Bias, Edge
+except ImportError:   # immagine senza libgpiod v2: si torna al polling
+    gpiod = None
+    import RPi.GPIO as GPIO
+
+GPIO_CHIP = "/dev/gpiochip0"
+ENABLE_PIN = 11
+NUMPAD_PIN = 10
+
+# Finestra anti-rimbalzo: ignora transizioni ripetute entro questo intervallo
+DEBOUNCE_MS = 20
+# Anti-rimbalzo kernel-side sugli impulsi del numpad
+PULSE_DEBOUNCE_MS = 5
 
 def keypad(callback=None, multiple = True, full_number_timeout = 1):
+    if gpiod is None:
+        return _keypad_polling(callback, multiple, full_number_timeout)
+
+    # Eventi edge dal kernel: ogni impulso del numpad finisce in una FIFO
+    # kernel con timestamp, quindi niente impulsi persi e CPU ~0 a riposo.
+    request = gpiod.request_lines(
+        GPIO_CHIP,
+        consumer="keypad",
+        config={
+            NUMPAD_PIN: gpiod.LineSettings(
+                bias=Bias.PULL_UP,
+                edge_detection=Edge.RISING,
+                debounce_period=timedelta(milliseconds=PULSE_DEBOUNCE_MS),
+            ),
+            ENABLE_PIN: gpiod.LineSettings(
+                bias=Bias.PULL_UP,
+                edge_detection=Edge.BOTH,
+            ),
+        },
+    )
+
+    print(f"Monitoraggio eventi GPIO {ENABLE_PIN} e {NUMPAD_PIN} (premi Ctrl+C per uscire)")
+    pulse_count = 0
+    full_number = ""
+    try:
+        while True:
+            # Con un numero in sospeso aspettiamo al massimo il timeout di
+            # composizione, altrimenti blocchiamo finché non arriva un edge.
+            timeout = full_number_timeout if (multiple and full_number) else None
+            if not request.wait_edge_events(timeout):
+                print(f" -> Full number: {full_number}")
+                if callback:
+                    callback(full_number)
+                full_number = ""
+                continue
+            for ev in request.read_edge_events():
+                if ev.line_offset == NUMPAD_PIN:
+                    pulse_count += 1
+                elif ev.event_type is ev.Type.FALLING_EDGE:
+                    # Disco ingaggiato: si riparte a contare gli impulsi
+                    pulse_count = 0
+                else:
+                    # Disco rilasciato: il conteggio è la cifra composta
+                    if pulse_count:
+                        number = 0 if pulse_count >= 10 else pulse_count
+                        print(f"{number}", end = "", flush = True)
+                        if callback and not multiple:
+                            callback(number)
+                        if multiple:
+                            full_number += str(number)
+                    pulse_count = 0
+
+    except KeyboardInterrupt:
+        print("\nUscita dal monitor.")
+    finally:
+        request.release()
+
+
+# Vecchio loop di polling (RPi.GPIO), usato solo come ripiego.
+def _keypad_polling(callback=None, multiple = True, full_number_timeout = 1):
     # Usa la numerazione BCM (i numeri GPIO, non i pin fisici)
     GPIO.setmode(GPIO.BCM)
 
-    enable_pin = 11
-    numpad_pin = 10
+    enable_pin = ENABLE_PIN
+    numpad_pin = NUMPAD_PIN
     p_keypad_state = 1
     p_enabled = 0
 
@@ -16,18 +92,31 @@ def keypad(callback=None, multiple = True, full_number_timeout = 1):
         GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
     print(f"Monitoraggio stato GPIO {PINS[0]} e {PINS[1]} (premi Ctrl+C per uscire)")
-    p_time = time.time()
+    debounce_s = DEBOUNCE_MS / 1000.0
+    last_rising_ts = 0.0
+    # Nomi locali: LOAD_FAST al posto di LOAD_GLOBAL+CALL a ogni giro (a
+    # 100 Hz su un Pi Zero si sente)
+    _input = GPIO.input
+    _monotonic = time.monotonic
+    _sleep = time.sleep
+    # Scadenza pre-calcolata: un confronto per iterazione invece di una
+    # sottrazione; time.monotonic() evita la traduzione wall-clock.
+    next_flush = _monotonic() + full_number_timeout
     full_number = ""
     try:
         while True:
-            enabled = not GPIO.input(enable_pin)
+            # Una sola lettura dell'orologio per iterazione
+            now = _monotonic()
+            enabled = not _input(enable_pin)
             if enabled == 1:
-                p_time = time.time()
+                next_flush = now + full_number_timeout
                 if enabled != p_enabled:
                     number = 0
-                keypad_state = GPIO.input(numpad_pin)
+                keypad_state = _input(numpad_pin)
                 if keypad_state != p_keypad_state and keypad_state == 1:
-                    number+=1
+                    if now - last_rising_ts > debounce_s:
+                        number+=1
+                        last_rising_ts = now
                 p_keypad_state = keypad_state
             else:
                 if enabled != p_enabled:
@@ -44,12 +133,12 @@ def keypad(callback=None, multiple = True, full_number_timeout = 1):
                             #print(full_number)
             p_enabled = enabled
             if multiple:
-                if time.time()-p_time > full_number_timeout and len(full_number)>0:
+                if now > next_flush and len(full_number)>0:
                     print(f" -> Full number: {full_number}")
                     if callback:
                        callback(full_number)
                     full_number = ""
-            time.sleep(0.01)
+            _sleep(0.01)
 
     except KeyboardInterrupt:
         print("\nUscita dal monitor.")
@@ -5,16 +5,18 @@
 # @brief This script is designed to monitor a GPIO pin, play an audio message, and record audio based on the state of the pin.
 
 import logging
+import os
+import signal
+import threading
 import time
 import subprocess
-import threading
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from player import play_audio, stop_audio
+from player import stop_audio
 
-import RPi.GPIO as GPIO
+import hooksm
+from playback import play_message, preload
 
 # ---------------------------------------------------------------------------#
 # Logging setup                                                              #
@@ -28,7 +30,7 @@ log = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------#
 # Configuration                                                              #
 # ---------------------------------------------------------------------------#
-PIN = 17                                   # GPIO pin to monitor (BCM scheme)
+PIN = 17                                   # GPIO line to monitor (BCM scheme)
 MESSAGE_FILE = "message_edited.wav"        # Audio message to be reproduced
 RECORD_DIR = Path("recordings")            # Directory where recordings land
 # Use PulseAudio’s recorder. “--format=cd --file-format=wav” is the closest
@@ -42,75 +44,109 @@ RECORD_CMD = [
     device,
     "--file-format=wav",
 ]
-POLL_DELAY = 0.01                          # Seconds between GPIO polls
-# ---------------------------------------------------------------------------#
-
-## @brief Prepare the GPIO subsystem.
-def setup_gpio() -> None:
-    GPIO.setmode(GPIO.BCM)
-    GPIO.setup(PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
-    log.info("GPIO initialised (BCM pin %s).", PIN)
-
-## @brief Read the monitored pin.
-#  @return 0 (LOW) or 1 (HIGH).
-def read_gpio() -> int:
-    return GPIO.input(PIN)
-
-# ---------------------------------------------------------------------------#
-# Playback helper                                                            #
+RT_PRIORITY = 50                           # SCHED_FIFO priority for the dispatcher
+RECORD_NICE = -10                          # Niceness for the recorder group
 # ---------------------------------------------------------------------------#
 
-## @brief Play MESSAGE_FILE and return a Thread that finishes when playback ends.
-#  @param blocking If `blocking=True` the function itself will not return until the audio
-#  has been played, but the returned object is still a dummy Thread.
-#  @return thread
-def _play_message(blocking: bool = False) -> threading.Thread:
-    log.info("Starting message playback (%s, blocking=%s).", MESSAGE_FILE, blocking)
-    if blocking:
-        play_audio(MESSAGE_FILE, blocking=True)
-        log.info("Message playback finished (blocking path).")
-        return threading.current_thread()  # never queried
-
-    thread = threading.Thread(
-        target=play_audio,
-        args=(MESSAGE_FILE,),
-        kwargs={"blocking": True},  # inside thread: blocking; outside: non-blocking
-        daemon=True,
-    )
-    thread.start()
-    return thread
+## @brief Move the GPIO dispatcher into the real-time scheduling class.
+#  rclone/ffmpeg bursts can preempt a SCHED_OTHER thread for ≥10 ms between
+#  the kernel IRQ and our dispatch; SCHED_FIFO removes that jitter.  Needs
+#  CAP_SYS_NICE (the service unit sets AmbientCapabilities=CAP_SYS_NICE) —
+#  without it we just log and stay on the default scheduler.  If the kernel
+#  was booted with isolcpus=, the process is also pinned to the first
+#  isolated core so the heavy helpers stay on the others.
+def raise_dispatch_priority() -> None:
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(RT_PRIORITY))
+        log.info("Dispatcher on SCHED_FIFO priority %d.", RT_PRIORITY)
+    except PermissionError:
+        log.warning("No CAP_SYS_NICE — dispatcher stays on SCHED_OTHER.")
+        return
+    try:
+        isolated = Path("/sys/devices/system/cpu/isolated").read_text().strip()
+        if isolated:
+            core = int(isolated.split(",")[0].split("-")[0])
+            os.sched_setaffinity(0, {core})
+            log.info("Dispatcher pinned to isolated core %d.", core)
+    except (OSError, ValueError):
+        pass
 
 # ---------------------------------------------------------------------------#
 # Recording helper                                                           #
 # ---------------------------------------------------------------------------#
 
 ## @brief Minimal wrapper around a recording subprocess (e.g. `parecord`).
+#  start()/stop() are serialized by a lock: the playback-done pipe and the
+#  GPIO edges are dispatched from the same selector loop, but a bounced
+#  contact could deliver two rising edges back to back — without the lock
+#  the second start() would leak an orphan parecord writing to a file
+#  nobody tracks.
 class Recorder:
     def __init__(self) -> None:
         self.proc: Optional[subprocess.Popen[str]] = None
         self.file: Optional[Path] = None
         self.start_time: Optional[float] = None
+        self._lock = threading.Lock()
 
-    ## @brief Start recording.
+    ## @brief Start recording. A no-op if a recorder is already running.
     def start(self) -> None:
+        with self._lock:
+            self._start_locked()
+
+    def _start_locked(self) -> None:
+        if self.proc is not None and self.proc.poll() is None:
+            log.warning("Recorder already running — ignoring start.")
+            return
         RECORD_DIR.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         self.file = RECORD_DIR / f"call_{timestamp}.wav"
         cmd = [*RECORD_CMD, str(self.file)]
         log.info("Starting recording → %s", self.file)
-        self.proc = subprocess.Popen(cmd, start_new_session=True)
+        # Discard parecord's chatter: an unread pipe filling up would stall
+        # the recorder mid-call.  process_group=0 gives the recorder its own
+        # group without the extra setsid() a full new session would cost.
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            process_group=0,
+        )
+        # Boost the recorder group from the parent instead of a preexec_fn:
+        # preexec_fn would force a full fork() and give up subprocess's vfork
+        # fast path.  Without CAP_SYS_NICE the boost is skipped silently —
+        # the default niceness still records fine, it just competes with
+        # rclone/ffmpeg bursts for CPU.
+        try:
+            os.setpriority(os.PRIO_PGRP, self.proc.pid, RECORD_NICE)
+        except (PermissionError, ProcessLookupError):
+            pass
         self.start_time = time.time()
 
     ## @brief Stop recording.
+    #  parecord flushes the WAV header on SIGINT, so try that first and only
+    #  escalate to SIGTERM/SIGKILL if it does not exit — fewer truncated
+    #  recordings.  Signals go to the whole process group (the recorder has
+    #  its own, see start) so any helper parecord forked dies with it, and
+    #  the flush itself is sub-100 ms, hence the short waits.
     def stop(self) -> None:
+        with self._lock:
+            self._stop_locked()
+
+    def _stop_locked(self) -> None:
         if self.proc and self.proc.poll() is None and (time.time() - self.start_time) > 1:
             log.info("Stopping recording.")
-            self.proc.terminate()
+            os.killpg(self.proc.pid, signal.SIGINT)
             try:
-                self.proc.wait(timeout=2)
+                self.proc.wait(timeout=0.5)
             except subprocess.TimeoutExpired:
-                log.warning("Recorder did not terminate, killing.")
-                self.proc.kill()
+                os.killpg(self.proc.pid, signal.SIGTERM)
+                try:
+                    self.proc.wait(timeout=0.2)
+                except subprocess.TimeoutExpired:
+                    log.warning("Recorder did not terminate, killing.")
+                    self.proc.kill()
             if self.file:
                 log.info("Recording saved: %s", self.file)
         self.proc = None
@@ -121,66 +157,71 @@ class Recorder:
 # Main loop                                                                  #
 # ---------------------------------------------------------------------------#
 
-## @brief Implements the following state machine:
-#  • IDLE: waiting for GPIO to go from HIGH (1) to LOW (0).
-#  • PLAY_MESSAGE: reproducing MESSAGE_FILE. If GPIO returns HIGH before
+## @brief Implements the following state machine on top of hooksm.run():
+#  • IDLE: waiting for a rising edge on PIN.
+#  • PLAY_MESSAGE: reproducing MESSAGE_FILE. If a falling edge arrives before
 #  playback completes → abort and return to IDLE.
-#  When playback finishes while GPIO is still LOW → start recording.
-#  • RECORDING: capturing audio whilst GPIO stays LOW.
-#  When GPIO returns HIGH → stop recording and return to IDLE.
+#  When playback finishes while the handset is still up → start recording.
+#  • RECORDING: capturing audio until the next falling edge.
+#  When it arrives → stop recording and return to IDLE.
+#
+#  Playback completion is delivered through a self-pipe registered with
+#  hooksm's selector, so the PLAY_MESSAGE → RECORDING transition fires the
+#  instant the message ends — no timeout, no is_alive() polling.
 def main() -> None:
     subprocess.run(["paplay", "o95.wav"])
-    setup_gpio()
-    last_level = read_gpio()
-    state = "IDLE"
+    raise_dispatch_priority()
+    preload(MESSAGE_FILE)
 
-    message_thread: Optional[threading.Thread] = None
     recorder = Recorder()
+    state = "IDLE"
 
-    try:
-        while True:
-            level = read_gpio()
-
-            falling_edge = last_level == 1 and level == 0
-            rising_edge = last_level == 0 and level == 1
-
-            # ----------------------------- IDLE ----------------------------- #
-            if state == "IDLE" and rising_edge:
-                time.sleep(0.5)
-                log.info("Hang down detected (rising edge) → playing message.")
-                message_thread = _play_message(blocking=False)
-                state = "PLAY_MESSAGE"
-
-            # ------------------------ PLAY_MESSAGE ------------------------- #
-            elif state == "PLAY_MESSAGE":
-                # Abort if pin goes high before message ends
-                if falling_edge:
-                    log.info("Hang up detected during playback → aborting.")
-                    stop_audio()
-                    state = "IDLE"
-                # Start recording once playback finishes
-                elif message_thread and not message_thread.is_alive():
-                    log.info("Message playback finished → starting recording.")
-                    recorder.start()
-                    state = "RECORDING"
-
-            # -------------------------- RECORDING -------------------------- #
-            elif state == "RECORDING" and falling_edge:
-                log.info("Hang down detected.")
-                recorder.stop()
-                state = "IDLE"
-
-            last_level = level
-            time.sleep(POLL_DELAY)
-
-    except KeyboardInterrupt:
-        log.info("Keyboard interrupt received – exiting.")
+    done_r, done_w = os.pipe()
+    os.set_blocking(done_r, False)
+
+    def on_rising() -> None:
+        nonlocal state
+        if state != "IDLE":
+            return
+        time.sleep(0.5)
+        log.info("Hang down detected (rising edge) → playing message.")
+        hooksm.drain(done_r)   # discard signals from an aborted playback
+        play_message(MESSAGE_FILE, done_w)
+        state = "PLAY_MESSAGE"
+
+    def on_falling() -> None:
+        nonlocal state
+        if state == "PLAY_MESSAGE":
+            log.info("Hang up detected during playback → aborting.")
+            stop_audio()
+            state = "IDLE"
+        elif state == "RECORDING":
+            log.info("Hang down detected.")
+            recorder.stop()
+            state = "IDLE"
+
+    def on_playback_done() -> None:
+        nonlocal state
+        if state != "PLAY_MESSAGE":
+            return
+        log.info("Message playback finished → starting recording.")
+        recorder.start()
+        state = "RECORDING"
 
+    try:
+        hooksm.run(
+            on_rising,
+            on_falling,
+            pin=PIN,
+            consumer="ans-machine",
+            aux_fd=done_r,
+            on_aux=on_playback_done,
+        )
     finally:
         stop_audio()
         recorder.stop()
-        GPIO.cleanup()
-        log.info("GPIO cleaned up. Bye!")
+        os.close(done_r)
+        os.close(done_w)
 
 
 if __name__ == "__main__":
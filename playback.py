@@ -0,0 +1,170 @@
+# @file playback.py
+# @author Alberto Occelli
+# @brief Playback helpers shared by the hook-driven entry points: the fixed
+# answering-machine message and the daily "accadde oggi" event clips.
+
+import logging
+import os
+import queue
+import random
+import subprocess
+import threading
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+from player import play_audio
+
+log = logging.getLogger(__name__)
+
+EVENTS_DIR = Path("events")                # Clips produced by generate_facts
+PCM_DIR = Path("events_pcm")               # Pre-decoded 16 kHz mono WAV cache
+
+# Index the clip directory once at import time; the hot path only re-globs
+# when the directory mtime changes (one stat syscall instead of two
+# directory walks on every pickup).
+_EVENT_FILES: List[Path] = []
+_EVENT_DIR_MTIME: float = 0.0
+_SRC_DIR_MTIME: float = 0.0
+# Cursor over a pre-shuffled permutation of the clips: every clip plays once
+# before any repeats, and each pickup costs O(1) instead of an O(N) shuffle.
+_event_cursor: Iterator[Path] = iter(())
+
+## @brief Pre-decode every events/*.mp3 into events_pcm/<name>.wav.
+#  Playing raw PCM skips the MP3 decode on every pickup, so back-to-back
+#  clips start with no decoder warm-up stall.
+#  This runs on the hook-pickup path while generate_facts may still be
+#  writing clips, so a partial or broken mp3 must not kill the dispatcher:
+#  a failed decode is logged and skipped (it is retried when the source
+#  directory's mtime advances), and the WAV lands under a temp name first
+#  so a half-written cache entry can never shadow a later good decode.
+def ensure_pcm_cache() -> None:
+    PCM_DIR.mkdir(exist_ok=True)
+    for src in EVENTS_DIR.glob("*.mp3"):
+        dst = PCM_DIR / f"{src.stem}.wav"
+        if dst.exists() and dst.stat().st_mtime >= src.stat().st_mtime:
+            continue
+        tmp = PCM_DIR / f"{src.stem}.wav.tmp"
+        try:
+            subprocess.run(
+                ["ffmpeg", "-y", "-loglevel", "error", "-i", str(src),
+                 "-ar", "16000", "-ac", "1", "-f", "wav",
+                 "-acodec", "pcm_s16le", str(tmp)],
+                check=True,
+            )
+            os.replace(tmp, dst)
+        except (subprocess.CalledProcessError, OSError):
+            log.warning("Could not decode %s — skipping for now.", src.name)
+            tmp.unlink(missing_ok=True)
+    # Drop cache entries whose source clip is gone (stale day), plus any
+    # temp file a crashed run left behind.
+    for cached in PCM_DIR.glob("*.wav"):
+        if not (EVENTS_DIR / f"{cached.stem}.mp3").exists():
+            cached.unlink()
+    for leftover in PCM_DIR.glob("*.wav.tmp"):
+        leftover.unlink()
+    _event_files()   # warm the index
+
+## @brief Return the cached list of event clips, refreshing it on change.
+#  While generate_facts is still producing today's clips, every new mp3
+#  bumps the events/ mtime; we decode it on the spot, so the first clip is
+#  playable as soon as the first TTS finishes rather than after the whole
+#  batch — the filesystem acts as the producer/consumer queue between the
+#  generator process and this one.
+def _event_files() -> List[Path]:
+    global _EVENT_FILES, _EVENT_DIR_MTIME, _SRC_DIR_MTIME, _event_cursor
+    try:
+        src_mtime = EVENTS_DIR.stat().st_mtime
+    except FileNotFoundError:
+        src_mtime = 0.0
+    if src_mtime != _SRC_DIR_MTIME:
+        _SRC_DIR_MTIME = src_mtime
+        ensure_pcm_cache()
+    try:
+        mtime = PCM_DIR.stat().st_mtime
+    except FileNotFoundError:
+        return []
+    if mtime != _EVENT_DIR_MTIME:
+        _EVENT_FILES = sorted(PCM_DIR.glob("*.wav"))
+        _EVENT_DIR_MTIME = mtime
+        _event_cursor = iter(())   # clip set changed → deal a fresh permutation
+        log.info("Event index refreshed: %d clips.", len(_EVENT_FILES))
+    return _EVENT_FILES
+
+## @brief Return the next clip from the shuffled cycle, re-dealing a new
+#  permutation (random.sample keeps the cache untouched) when exhausted.
+def _next_event() -> Optional[Path]:
+    global _event_cursor
+    files = _event_files()
+    if not files:
+        return None
+    try:
+        return next(_event_cursor)
+    except StopIteration:
+        _event_cursor = iter(random.sample(files, len(files)))
+        return next(_event_cursor)
+
+## @brief One long-lived worker thread runs all playback jobs in order.
+#  Spawning a thread per pickup costs ~1 ms plus a fresh stack on a Pi Zero;
+#  a single daemon worker draining a queue pays that once at startup.
+_PLAY_QUEUE: "queue.Queue[Callable[[], None]]" = queue.Queue()
+
+def _play_worker() -> None:
+    while True:
+        job = _PLAY_QUEUE.get()
+        try:
+            job()
+        except Exception:
+            log.exception("Playback job failed.")
+
+_PLAY_THREAD = threading.Thread(target=_play_worker, daemon=True)
+_PLAY_THREAD.start()
+
+## @brief Read *path* once so its pages are resident before the first pickup.
+#  The message WAV is raw PCM (no decode needed), but on a cold boot the
+#  first playback would still wait on an SD-card read; touching the file at
+#  startup moves that cost out of the handset-lift path.
+def preload(path: str) -> None:
+    try:
+        Path(path).read_bytes()
+    except OSError:
+        log.warning("Could not preload %s.", path)
+
+## @brief Queue *path* for playback on the shared worker thread.
+#  @param done_fd Optional pipe write end; one byte is written when playback
+#  ends, so a selector-driven caller wakes exactly at that moment.
+def play_message(path: str, done_fd: Optional[int] = None) -> None:
+    log.info("Starting message playback (%s).", path)
+
+    def _job() -> None:
+        play_audio(path, blocking=True)
+        if done_fd is not None:
+            os.write(done_fd, b"x")
+
+    _PLAY_QUEUE.put(_job)
+
+## @brief Queue one random event clip for playback.
+#  @return True if a clip was queued, False if none are available.
+def play_random_event() -> bool:
+    event_file = _next_event()
+    if event_file is None:
+        log.warning("No event clips in %s — nothing to play.", PCM_DIR)
+        return False
+    log.info("Playing event clip %s.", event_file.name)
+    play_message(str(event_file))
+    return True
+
+## @brief Queue every event clip for back-to-back playback.
+#  @return True if clips were queued, False if none are available.
+def play_all_events() -> bool:
+    files = _event_files()
+    if not files:
+        log.warning("No event clips in %s — nothing to play.", PCM_DIR)
+        return False
+
+    def _job() -> None:
+        for event_file in files:
+            play_audio(str(event_file), blocking=True)
+
+    log.info("Playing all %d event clips.", len(files))
+    _PLAY_QUEUE.put(_job)
+    return True
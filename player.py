@@ -27,31 +27,85 @@
 
 from __future__ import annotations
 
+import ctypes
+import functools
+import json
+import mmap
 import os
+import signal
+import socket
+import struct
 import sys
 import shutil
 import threading
+import time
 import subprocess
 from pathlib import Path
-from typing import Optional, Callable, Any, List, Tuple
+from typing import Optional, Callable, Any, Dict, List, Tuple
 
-## @brief Internals – keep track of non-blocking playbacks so we can stop them later
-_PLAYBACK_HANDLES: List[Tuple[str, Any]] = []   # (backend identifier, handle)
+## @brief Internals – keep track of non-blocking playbacks so we can stop them later.
+## Keyed by id(handle): registration, removal and membership are all O(1)
+## instead of the linear scans a (backend, handle) tuple list needs.
+_PLAYBACK_HANDLES: Dict[int, Tuple[str, Any]] = {}
 _PLAYBACK_LOCK = threading.Lock()
 
+## @brief Memoized shutil.which: the raw call walks every $PATH entry (a
+## stat per directory) and the answer is stable for the lifetime of the
+## process. refresh_backends() clears the cache if a player is installed
+## while we are running.
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    return shutil.which(name)
+
+## @brief Backend availability, probed once at import time.
+_HAS_MPV = _which("mpv") is not None
+_BACKEND_AVAILABLE = {
+    "aplay": _which("aplay") is not None,
+    "mpg123": _which("mpg123") is not None,
+}
+
+## @brief Optional override: set PI_AUDIO_BACKEND to "mpv" or "subprocess"
+## (or "alsa") to pin one backend and skip the fallback chain entirely on
+## deployments where the choice is known up front.
+_FORCED_BACKEND = os.environ.get("PI_AUDIO_BACKEND")
+
 ## @brief Remember a playback handle so that `stop_audio()` can later terminate it.
 ## Handles are now registered *regardless* of the `blocking` flag so that
 ## even “blocking” playbacks running in a separate `_PlayThread` can be
 ## interrupted from the outside.
 def _register_playback(backend: str, handle: Any) -> None:
     with _PLAYBACK_LOCK:
-        _PLAYBACK_HANDLES.append((backend, handle))
+        _PLAYBACK_HANDLES[id(handle)] = (backend, handle)
+
+## @brief SIGCHLD-driven reaping: poll() costs a waitpid syscall per call,
+## and stop_audio used to issue one per handle per check. Instead, reap
+## exactly when a child exits — the handler polls the registered handles so
+## Popen records the exit status, and active-checks degrade to reading
+## handle.returncode. Deliberately *not* waitpid(-1): that would steal exit
+## statuses from children other modules own (parecord, ffmpeg, mpv).
+def _reap_children(signum: int, frame: Any) -> None:
+    # Snapshot instead of the lock: the handler runs on the main thread
+    # between bytecodes and must not block on a lock that thread may hold.
+    for _backend, handle in list(_PLAYBACK_HANDLES.values()):
+        try:
+            handle.poll()
+        except Exception:
+            pass
+
+try:
+    signal.signal(signal.SIGCHLD, _reap_children)
+    _REAPER_INSTALLED = True
+except ValueError:
+    # Imported from a non-main thread: no handler, fall back to polling.
+    _REAPER_INSTALLED = False
 
 ## @brief Helper that returns True if the supplied handle is believed to be
 ## currently playing.
 def _is_handle_active(backend: str, handle: Any) -> bool:
     try:
         if backend in ["aplay", "mpg123"]:
+            if _REAPER_INSTALLED:
+                return handle.returncode is None
             return handle.poll() is None
     except Exception:
         return False
@@ -64,51 +118,319 @@ def _is_handle_active(backend: str, handle: Any) -> bool:
 ##
 ## @return bool True if at least one playback was stopped, False otherwise.
 def stop_audio() -> bool:
-    stopped_any = False
+    stopped_any = _alsa_stop()
+    stopped_any = _mpv_stop() or stopped_any
     with _PLAYBACK_LOCK:
-        # Work on a copy so we can modify the original list while iterating
-        for backend, handle in _PLAYBACK_HANDLES[:]:
+        # Single pass: decide each handle's fate once and collect the
+        # survivors. Checking liveness once per handle keeps this O(n);
+        # per-entry removal is an O(1) dict delete anyway.
+        survivors: Dict[int, Tuple[str, Any]] = {}
+        for key, (backend, handle) in _PLAYBACK_HANDLES.items():
+            if not _is_handle_active(backend, handle):
+                continue   # already finished → just forget it
             try:
-                if not _is_handle_active(backend, handle):
-                    _PLAYBACK_HANDLES.remove((backend, handle))
-                    continue
-
                 if backend in ["aplay", "mpg123"]:
-                    handle.terminate()
+                    # The players run in their own session (start_new_session),
+                    # so one killpg stops the leader and any helper it forked,
+                    # instead of SIGTERM-ing the leader and hoping.
+                    try:
+                        os.killpg(handle.pid, signal.SIGTERM)
+                    except (ProcessLookupError, PermissionError):
+                        handle.terminate()
                     handle.wait(timeout=1)
+                    stopped_any = True
                 else:
-                    continue
-                stopped_any = True
+                    survivors[key] = (backend, handle)
             except Exception:
-                # Ignore individual failures but keep processing others
-                pass
-            finally:
-                # Drop handle if it no longer plays
-                if not _is_handle_active(backend, handle):
-                    try:
-                        _PLAYBACK_HANDLES.remove((backend, handle))
-                    except ValueError:
-                        pass
+                # Could not confirm it stopped — keep it for the next pass
+                survivors[key] = (backend, handle)
+        # Same dict object throughout: the reaper snapshots it unlocked
+        _PLAYBACK_HANDLES.clear()
+        _PLAYBACK_HANDLES.update(survivors)
     return stopped_any
 
-## @brief This function is the back-end for aplay (ALSA, wav files) and mpg123 (mp3 files). 
+## @brief Internals – direct libasound playback for WAV files via ctypes.
+## On a minimal deployment this is the shortest possible path: no fork, no
+## external player, just snd_pcm_writei on a handle opened once. Anything
+## that is not 16-bit PCM WAV (or any libasound error) falls through to the
+## other backends.
+try:
+    _ALSA = ctypes.CDLL("libasound.so.2")
+    _ALSA.snd_pcm_open.argtypes = [
+        ctypes.POINTER(ctypes.c_void_p), ctypes.c_char_p, ctypes.c_int, ctypes.c_int]
+    _ALSA.snd_pcm_set_params.argtypes = [
+        ctypes.c_void_p, ctypes.c_int, ctypes.c_int,
+        ctypes.c_uint, ctypes.c_uint, ctypes.c_int, ctypes.c_uint]
+    _ALSA.snd_pcm_writei.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_ulong]
+    _ALSA.snd_pcm_writei.restype = ctypes.c_long
+    _ALSA.snd_pcm_recover.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
+    _ALSA.snd_pcm_drain.argtypes = [ctypes.c_void_p]
+    _ALSA.snd_pcm_drop.argtypes = [ctypes.c_void_p]
+except (OSError, AttributeError):
+    _ALSA = None
+
+_SND_PCM_STREAM_PLAYBACK = 0
+_SND_PCM_FORMAT_S16_LE = 2
+_SND_PCM_ACCESS_RW_INTERLEAVED = 3
+_ALSA_LATENCY_US = 500_000
+_ALSA_CHUNK_FRAMES = 1024          # ~64 ms at 16 kHz: stop-check granularity
+
+_ALSA_HANDLE = ctypes.c_void_p()
+_ALSA_LOCK = threading.Lock()      # one PCM stream at a time
+_ALSA_STOP = threading.Event()
+_ALSA_ACTIVE = threading.Event()
+
+## @brief mmap *path* and return (pcm_array, channels, rate) for its data
+## chunk, or None if it is not plain 16-bit PCM. The ctypes array is built
+## with from_buffer over the mapping — no copy into the Python heap, the
+## samples stay page-cache backed and are reused across playbacks (the
+## cache key includes mtime+size for invalidation).
+@functools.lru_cache(maxsize=16)
+def _wav_pcm_map(path: str, mtime_ns: int, size: int):
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    if mm[:4] != b"RIFF" or mm[8:12] != b"WAVE":
+        return None
+    fmt = None
+    pos = 12
+    while pos + 8 <= size:
+        chunk_id = mm[pos:pos + 4]
+        chunk_size = int.from_bytes(mm[pos + 4:pos + 8], "little")
+        if chunk_id == b"fmt ":
+            fmt = struct.unpack_from("<HHIIHH", mm, pos + 8)
+        elif chunk_id == b"data" and fmt is not None:
+            audio_format, channels, rate, _, _, bits = fmt
+            if audio_format != 1 or bits != 16:
+                return None
+            data_len = min(chunk_size, size - pos - 8)
+            arr = (ctypes.c_char * data_len).from_buffer(mm, pos + 8)
+            return arr, channels, rate
+        pos += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+## @brief Feed interleaved S16LE frames to the shared PCM handle.
+def _alsa_write(arr, channels: int, rate: int) -> bool:
+    with _ALSA_LOCK:
+        if not _ALSA_HANDLE:
+            if _ALSA.snd_pcm_open(ctypes.byref(_ALSA_HANDLE), b"default",
+                                  _SND_PCM_STREAM_PLAYBACK, 0) < 0:
+                return False
+        # set_params also (re)prepares the stream after a drain/drop
+        if _ALSA.snd_pcm_set_params(_ALSA_HANDLE, _SND_PCM_FORMAT_S16_LE,
+                                    _SND_PCM_ACCESS_RW_INTERLEAVED,
+                                    channels, rate, 1, _ALSA_LATENCY_US) < 0:
+            return False
+        _ALSA_STOP.clear()
+        _ALSA_ACTIVE.set()
+        try:
+            frame_size = channels * 2
+            total = len(arr) // frame_size
+            offset = 0
+            while offset < total and not _ALSA_STOP.is_set():
+                n = min(_ALSA_CHUNK_FRAMES, total - offset)
+                # Pointer into the mapping at the current frame — zero-copy
+                rc = _ALSA.snd_pcm_writei(
+                    _ALSA_HANDLE, ctypes.byref(arr, offset * frame_size), n)
+                if rc < 0:
+                    if _ALSA.snd_pcm_recover(_ALSA_HANDLE, rc, 1) < 0:
+                        return False
+                    continue
+                offset += rc
+            if _ALSA_STOP.is_set():
+                _ALSA.snd_pcm_drop(_ALSA_HANDLE)
+            else:
+                _ALSA.snd_pcm_drain(_ALSA_HANDLE)
+            return True
+        finally:
+            _ALSA_ACTIVE.clear()
+
+## @brief Play a 16-bit PCM WAV straight through libasound.
+## @returns True on success, False if the file or the library rule it out.
+def _play_with_alsa(file_path: str, blocking: bool) -> bool:
+    if _ALSA is None or not file_path.lower().endswith(".wav"):
+        return False
+    try:
+        st = os.stat(file_path)
+        pcm = _wav_pcm_map(file_path, st.st_mtime_ns, st.st_size)
+    except (OSError, ValueError):
+        return False
+    if pcm is None:
+        return False
+    arr, channels, rate = pcm
+    if blocking:
+        return _alsa_write(arr, channels, rate)
+    threading.Thread(
+        target=_alsa_write, args=(arr, channels, rate), daemon=True
+    ).start()
+    return True
+
+## @brief Interrupt a playback running on the libasound backend, if any.
+def _alsa_stop() -> bool:
+    if not _ALSA_ACTIVE.is_set():
+        return False
+    _ALSA_STOP.set()   # the writer thread drops the stream and exits
+    return True
+
+## @brief Internals – one long-lived mpv process shared by every playback.
+## Spawning a player per clip costs fork+exec+ALSA-open (tens of ms on a Pi);
+## a persistent mpv in idle mode driven over its JSON IPC socket pays that
+## once at startup, so per-clip start latency drops to ~1 ms.
+_MPV_SOCKET_PATH = "/tmp/rpi-ans-player.sock"
+_MPV: Optional[Tuple[Any, socket.socket]] = None   # (Popen, connected socket)
+_MPV_LOCK = threading.Lock()
+_MPV_SEND_LOCK = threading.Lock()
+_MPV_PLAYING = threading.Event()
+_MPV_END = threading.Event()       # set when the current load finishes
+_MPV_END_OK = True                 # False when it ended with reason "error"
+
+## @brief Socket reader owned by the shared mpv connection. A single thread
+## consumes every IPC event, so nothing can steal another waiter's bytes:
+## natural finishes ("eof") and failures ("error") clear _MPV_PLAYING and
+## release a blocking waiter; "stop" events (our own stop command, or the
+## old file being replaced by a new loadfile) are _mpv_stop's business and
+## are ignored here, which also makes stale-event draining unnecessary.
+def _mpv_reader(sock: socket.socket) -> None:
+    global _MPV_END_OK
+    buf = b""
+    while True:
+        try:
+            chunk = sock.recv(4096)
+        except OSError:
+            chunk = b""
+        if not chunk:          # mpv died: fail any waiter and stop reading
+            _MPV_END_OK = False
+            _MPV_PLAYING.clear()
+            _MPV_END.set()
+            return
+        buf += chunk
+        *lines, buf = buf.split(b"\n")
+        for line in lines:
+            if b'"end-file"' not in line:
+                continue
+            try:
+                reason = json.loads(line).get("reason")
+            except ValueError:
+                reason = None
+            if reason == "stop":
+                continue
+            _MPV_END_OK = reason != "error"
+            _MPV_PLAYING.clear()
+            _MPV_END.set()
+
+## @brief Return a connected IPC socket to the shared mpv, starting it on
+## first use. Returns None when mpv is not installed or does not come up.
+def _mpv_ensure() -> Optional[socket.socket]:
+    global _MPV
+    with _MPV_LOCK:
+        if _MPV and _MPV[0].poll() is None:
+            return _MPV[1]
+        if not _HAS_MPV:
+            return None
+        try:
+            os.unlink(_MPV_SOCKET_PATH)
+        except FileNotFoundError:
+            pass
+        proc = subprocess.Popen(
+            ["mpv", "--idle=yes", "--no-video", "--no-terminal",
+             "--really-quiet", f"--input-ipc-server={_MPV_SOCKET_PATH}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        deadline = time.monotonic() + 2.0
+        while True:
+            try:
+                sock.connect(_MPV_SOCKET_PATH)
+                break
+            except (FileNotFoundError, ConnectionRefusedError):
+                if time.monotonic() > deadline or proc.poll() is not None:
+                    proc.terminate()
+                    return None
+                time.sleep(0.05)
+        _MPV = (proc, sock)
+        threading.Thread(target=_mpv_reader, args=(sock,), daemon=True).start()
+        return sock
+
+## @brief Send one command over the mpv JSON IPC socket.
+def _mpv_send(sock: socket.socket, *command: Any) -> None:
+    payload = json.dumps({"command": list(command)}).encode() + b"\n"
+    with _MPV_SEND_LOCK:
+        sock.sendall(payload)
+
+## @brief Play *file_path* through the shared mpv instance.
+## @returns True if mpv played (or is playing) the file, False if the
+## backend is unusable or mpv could not play it (end-file reason "error"),
+## so the caller falls back to the per-clip subprocess path.
+def _play_with_mpv(file_path: str, blocking: bool) -> bool:
+    sock = _mpv_ensure()
+    if sock is None:
+        return False
+    try:
+        _MPV_END.clear()   # before loadfile, so the finish cannot be missed
+        _mpv_send(sock, "loadfile", file_path, "replace")
+        _MPV_PLAYING.set()
+        if blocking:
+            _MPV_END.wait()
+            return _MPV_END_OK
+        return True
+    except OSError:
+        _MPV_PLAYING.clear()
+        return False
+
+## @brief Ask the shared mpv to stop whatever it is playing.
+## @returns True if a playback was actually interrupted.
+def _mpv_stop() -> bool:
+    global _MPV_END_OK
+    if _MPV is None or not _MPV_PLAYING.is_set():
+        return False
+    try:
+        _mpv_send(_MPV[1], "stop")
+    except OSError:
+        return False
+    _MPV_PLAYING.clear()
+    # Release a blocking waiter; an interrupted playback is not a backend
+    # failure, so it must not trigger the fallback chain.
+    _MPV_END_OK = True
+    _MPV_END.set()
+    return True
+
+## @brief Fault *path* into the page cache and keep it resident.
+## The child player re-reads the file from scratch; on an SD card that is
+## tens of ms of first-byte latency on a cold cache. MAP_POPULATE makes the
+## kernel pre-fault every page at map time, and parking the mapping in the
+## LRU keeps the pages referenced across repeat playbacks of the same clip.
+@functools.lru_cache(maxsize=16)
+def _prewarm(path: str) -> Optional[mmap.mmap]:
+    try:
+        with open(path, "rb") as f:
+            return mmap.mmap(
+                f.fileno(), 0, prot=mmap.PROT_READ,
+                flags=mmap.MAP_SHARED | getattr(mmap, "MAP_POPULATE", 0))
+    except (OSError, ValueError):
+        return None
+
+## @brief This function is the back-end for aplay (ALSA, wav files) and mpg123 (mp3 files).
 ## It plays WAV files through ALSA with aplay and MP3 files with mpg123. 
 ## Suitable for systems where both .wav and .mp3 files are required.
 ## @param file_path The path of the file to play.
 ## @param blocking If True, the function will wait until the audio has finished playing.
 ## @returns True if the audio started playing, False otherwise.
 def _play_with_backend(file_path: str, blocking: bool) -> bool:
-    file_extension = os.path.splitext(file_path)[1]
-    if file_extension == ".wav":
+    # Suffix dispatch via str.endswith: splitext parses the whole path and
+    # allocates a tuple just to compare against two fixed extensions.
+    lower = file_path.lower()
+    if lower.endswith(".wav"):
         backend = "aplay"
-    elif file_extension == ".mp3":
+    elif lower.endswith(".mp3"):
         backend = "mpg123"
     else:
         return False
 
-    if not shutil.which(backend):
+    if not _BACKEND_AVAILABLE[backend]:
         return False
 
+    _prewarm(file_path)
     cmd = [backend, file_path]  # -q = quiet
     try:
         proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL,
@@ -116,11 +438,55 @@ def _play_with_backend(file_path: str, blocking: bool) -> bool:
                                 start_new_session=True)
         _register_playback(backend, proc)
         if blocking:
+            # The wait runs strictly outside _PLAYBACK_LOCK (released by
+            # _register_playback), so a concurrent stop_audio() is never
+            # stuck behind a clip-length wait. waitid with WNOWAIT sleeps
+            # in the kernel without consuming the exit status, so Popen —
+            # or the SIGCHLD reaper, whichever gets there first — can
+            # still record it.
+            try:
+                os.waitid(os.P_PID, proc.pid, os.WEXITED | os.WNOWAIT)
+            except ChildProcessError:
+                pass   # already reaped by the SIGCHLD handler
             proc.wait()
         return True
     except Exception:
         return False
 
+## @brief The dispatch chain, specialised once at import time: backends that
+## cannot possibly work on this machine (no libasound, no mpv, no players on
+## $PATH) never appear, and PI_AUDIO_BACKEND collapses the chain to a single
+## entry. play_audio just walks this tuple.
+def _build_chain() -> Tuple[Callable[[str, bool], bool], ...]:
+    forced = {
+        "alsa": _play_with_alsa,
+        "mpv": _play_with_mpv,
+        "subprocess": _play_with_backend,
+    }.get(_FORCED_BACKEND)
+    if forced is not None:
+        return (forced,)
+    chain: List[Callable[[str, bool], bool]] = []
+    if _ALSA is not None:
+        chain.append(_play_with_alsa)
+    if _HAS_MPV:
+        chain.append(_play_with_mpv)
+    if _BACKEND_AVAILABLE["aplay"] or _BACKEND_AVAILABLE["mpg123"]:
+        chain.append(_play_with_backend)
+    return tuple(chain)
+
+_CHAIN = _build_chain()
+
+## @brief Re-probe $PATH and rebuild the dispatch chain.
+## Only needed when a player gets installed (or removed) while the process
+## is running, or from tests that stub out backends.
+def refresh_backends() -> None:
+    global _HAS_MPV, _CHAIN
+    _which.cache_clear()
+    _HAS_MPV = _which("mpv") is not None
+    _BACKEND_AVAILABLE["aplay"] = _which("aplay") is not None
+    _BACKEND_AVAILABLE["mpg123"] = _which("mpg123") is not None
+    _CHAIN = _build_chain()
+
 ## @brief This is the master helper function. It plays an audio file through the default Raspberry Pi audio output.
 ## The function uses aplay for .wav audio playback and mpg123 for .mp3 audio playback. 
 ## It will raise FileNotFoundError if *path* does not exist, 
@@ -128,12 +494,26 @@ def _play_with_backend(file_path: str, blocking: bool) -> bool:
 ## @param path The path of the file to play.
 ## @param blocking If True, the function will wait until the audio has finished playing.
 ## @returns True if the audio started playing, False otherwise.
+## @brief Resolve *path* to an absolute string, raising if it is not a file.
+## expanduser+resolve walk symlinks and hit the filesystem on every call;
+## the answer is stable for a given path (the message file never moves), so
+## memoize it. Misses (FileNotFoundError) are not cached by lru_cache.
+@functools.lru_cache(maxsize=32)
+def _resolve(path_str: str) -> str:
+    p = Path(path_str).expanduser().resolve()
+    if not p.is_file():
+        raise FileNotFoundError(f"No such audio file: {p}")
+    return str(p)
+
 def play_audio(path: str | os.PathLike, *, blocking: bool = True) -> bool:
-    file_path = str(Path(path).expanduser().resolve())
-    if not Path(file_path).is_file():
-        raise FileNotFoundError(f"No such audio file: {file_path}")
+    file_path = _resolve(str(path))
 
-    return _play_with_backend(file_path, blocking)
+    # Shortest path first: in-process libasound for plain WAVs, then the
+    # warm shared player, then one process per clip (see _build_chain).
+    for backend in _CHAIN:
+        if backend(file_path, blocking):
+            return True
+    return False
 
 ## @brief This class is a threaded convenience wrapper. It is a background thread that executes `play_audio`.  
 ## The boolean return value is stored in `self.success` once playback has finished.
@@ -154,14 +534,39 @@ class _PlayThread(threading.Thread):
             # Swallow exceptions so that the thread never terminates with error
             self.success = False
 
-## @brief This function starts audio playback in a dedicated daemon thread and returns the thread.
-## The call itself is always non-blocking; if you need to wait for completion call `thread.join()`.  
-## The boolean result of `play_audio` can be inspected afterwards via `thread.success`.
+## @brief Trivial handle returned for fire-and-forget playbacks, mirroring
+## the bits of the `_PlayThread` surface callers actually use.
+class _DoneHandle:
+    __slots__ = ("success",)
+
+    def __init__(self, success: bool) -> None:
+        self.success = success
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        return None
+
+    def is_alive(self) -> bool:
+        return False
+
+## @brief This function starts audio playback and returns a joinable handle.
+## The call itself is always non-blocking. With `blocking=True` the playback
+## runs in a dedicated daemon thread; call `handle.join()` to wait for it.
+## With `blocking=False` the backend is started inline — `play_audio` returns
+## as soon as the player is launched, so spawning a thread whose only job is
+## to return immediately would waste a pthread per call.
+## The boolean result of `play_audio` can be inspected via `handle.success`.
 ## @param path The path of the file to play.
-## @param blocking If True, the function will wait until the audio has finished playing.
-## @returns _PlayThread instance running the playback.
-def play(path: str | os.PathLike, *, blocking: bool = True) -> _PlayThread:
-    thread = _PlayThread(path, blocking=blocking)
+## @param blocking If True, the playback thread waits until the audio has finished playing.
+## @returns A handle with `success`, `join()` and `is_alive()`.
+def play(path: str | os.PathLike, *, blocking: bool = True):
+    if not blocking:
+        try:
+            ok = play_audio(path, blocking=False)
+        except Exception:
+            # Same contract as _PlayThread: never raise, record failure
+            ok = False
+        return _DoneHandle(ok)
+    thread = _PlayThread(path, blocking=True)
     thread.start()
     return thread
 